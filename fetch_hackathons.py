@@ -4,122 +4,236 @@ Fetch all hackathons from Devpost API and save to CSV (Improved Async version wi
 """
 import aiohttp
 import asyncio
-import csv
+import gzip
+import orjson
+import os
+import pyarrow
+import pyarrow.compute
+import pyarrow.csv
+import pyarrow.parquet
+import random
 from typing import Dict, List, Optional
 import sys
 
-async def fetch_page_with_retry(session: aiohttp.ClientSession, page_num: int,
-                                  semaphore: asyncio.Semaphore, max_retries: int = 3) -> Optional[Dict]:
-    """Fetch a single page of hackathons with retry logic"""
+# Status codes that will never succeed on retry
+UNRECOVERABLE_STATUSES = {400, 401, 403}
+
+# Per-page ETag/Last-Modified cache so unchanged pages come back as 304
+ETAG_CACHE_FILE = 'etag_cache.json'
+
+# Limit concurrent requests to avoid overwhelming the server
+MAX_CONCURRENT = 10  # Reduced from 50
+
+def backoff_delay(attempt: int, base: float = 1.0, jitter: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with jitter so concurrent retries don't hit the server in lockstep"""
+    return min(cap, base * (2 ** attempt) * (1 + random.random() * jitter))
+
+def load_etag_cache(path: str = ETAG_CACHE_FILE) -> Dict[str, Dict]:
+    """Load the page cache from disk, starting empty if it is missing or unreadable"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"Ignoring unreadable cache {path}: {e}", file=sys.stderr, flush=True)
+        return {}
+
+def save_etag_cache(cache: Dict[str, Dict], path: str = ETAG_CACHE_FILE):
+    """Write the page cache to disk"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(cache))
+
+async def fetch_page_with_retry(session: aiohttp.ClientSession, page_num: int, max_retries: int = 3,
+                                  cache: Optional[Dict[str, Dict]] = None) -> Optional[Dict]:
+    """Fetch a single page of hackathons with retry logic, revalidating against the cache"""
     url = f"https://devpost.com/api/hackathons?page={page_num}"
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         'Accept': 'application/json',
     }
 
-    async with semaphore:  # Limit concurrent requests
-        for attempt in range(max_retries):
-            try:
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 404:
-                        if attempt < max_retries - 1:
-                            # Wait a bit before retrying
-                            await asyncio.sleep(1 * (attempt + 1))
-                            continue
-                        else:
-                            return None
-                    else:
-                        response.raise_for_status()
-            except asyncio.TimeoutError:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 * (attempt + 1))
-                    continue
-                else:
-                    print(f"Timeout fetching page {page_num} after {max_retries} attempts",
+    cache_key = str(page_num)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    for attempt in range(max_retries):
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if cache is not None and data and 'hackathons' in data:
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        if etag or last_modified:
+                            cache[cache_key] = {
+                                'etag': etag,
+                                'last_modified': last_modified,
+                                'body': data['hackathons'],
+                                'meta': data.get('meta'),
+                            }
+                    return data
+                elif response.status == 304 and cached:
+                    return {'hackathons': cached['body'], 'meta': cached.get('meta')}
+                elif response.status in UNRECOVERABLE_STATUSES:
+                    print(f"Page {page_num} returned HTTP {response.status}, not retrying",
                           file=sys.stderr, flush=True)
                     return None
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 * (attempt + 1))
-                    continue
+                elif response.status == 404:
+                    if attempt < max_retries - 1:
+                        # Hand the connection back to the pool, then wait a bit before retrying
+                        response.release()
+                        await asyncio.sleep(backoff_delay(attempt))
+                        continue
+                    else:
+                        return None
                 else:
-                    print(f"Error fetching page {page_num} after {max_retries} attempts: {e}",
-                          file=sys.stderr, flush=True)
-                    return None
+                    # 429 and 5xx are retried below
+                    response.raise_for_status()
+        except asyncio.TimeoutError:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            else:
+                print(f"Timeout fetching page {page_num} after {max_retries} attempts",
+                      file=sys.stderr, flush=True)
+                return None
+        except Exception as e:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            else:
+                print(f"Error fetching page {page_num} after {max_retries} attempts: {e}",
+                      file=sys.stderr, flush=True)
+                return None
 
     return None
 
-def flatten_hackathon(hackathon: Dict) -> Dict:
-    """Flatten hackathon data for CSV export"""
+# CSV columns and their Arrow types, in output order
+CSV_SCHEMA = pyarrow.schema([
+    ('id', pyarrow.int64()),
+    ('title', pyarrow.string()),
+    ('url', pyarrow.string()),
+    ('organization_name', pyarrow.string()),
+    ('location', pyarrow.string()),
+    ('open_state', pyarrow.string()),
+    ('submission_period_dates', pyarrow.string()),
+    ('time_left_to_submission', pyarrow.string()),
+    ('prize_amount', pyarrow.string()),
+    ('cash_prizes_count', pyarrow.int64()),
+    ('other_prizes_count', pyarrow.int64()),
+    ('registrations_count', pyarrow.int64()),
+    ('themes', pyarrow.string()),
+    ('featured', pyarrow.bool_()),
+    ('winners_announced', pyarrow.bool_()),
+    ('invite_only', pyarrow.bool_()),
+    ('managed_by_devpost', pyarrow.bool_()),
+    ('thumbnail_url', pyarrow.string()),
+    ('submission_gallery_url', pyarrow.string()),
+])
+
+def append_hackathon(columns: Dict[str, list], hackathon: Dict):
+    """Flatten one hackathon onto the end of each per-column list"""
     themes = ', '.join([theme['name'] for theme in hackathon.get('themes', [])])
+    prizes_counts = hackathon.get('prizes_counts', {})
+    thumbnail_url = hackathon.get('thumbnail_url')
 
-    return {
-        'id': hackathon.get('id'),
-        'title': hackathon.get('title'),
-        'url': hackathon.get('url'),
-        'organization_name': hackathon.get('organization_name'),
-        'location': hackathon.get('displayed_location', {}).get('location'),
-        'open_state': hackathon.get('open_state'),
-        'submission_period_dates': hackathon.get('submission_period_dates'),
-        'time_left_to_submission': hackathon.get('time_left_to_submission'),
-        'prize_amount': hackathon.get('prize_amount', '').replace('<span data-currency-value>', '').replace('</span>', ''),
-        'cash_prizes_count': hackathon.get('prizes_counts', {}).get('cash', 0),
-        'other_prizes_count': hackathon.get('prizes_counts', {}).get('other', 0),
-        'registrations_count': hackathon.get('registrations_count'),
-        'themes': themes,
-        'featured': hackathon.get('featured'),
-        'winners_announced': hackathon.get('winners_announced'),
-        'invite_only': hackathon.get('invite_only'),
-        'managed_by_devpost': hackathon.get('managed_by_devpost_badge'),
-        'thumbnail_url': 'https:' + hackathon.get('thumbnail_url', '') if hackathon.get('thumbnail_url') else '',
-        'submission_gallery_url': hackathon.get('submission_gallery_url'),
-    }
+    columns['id'].append(hackathon.get('id'))
+    columns['title'].append(hackathon.get('title'))
+    columns['url'].append(hackathon.get('url'))
+    columns['organization_name'].append(hackathon.get('organization_name'))
+    columns['location'].append(hackathon.get('displayed_location', {}).get('location'))
+    columns['open_state'].append(hackathon.get('open_state'))
+    columns['submission_period_dates'].append(hackathon.get('submission_period_dates'))
+    columns['time_left_to_submission'].append(hackathon.get('time_left_to_submission'))
+    columns['prize_amount'].append(
+        hackathon.get('prize_amount', '').replace('<span data-currency-value>', '').replace('</span>', ''))
+    columns['cash_prizes_count'].append(prizes_counts.get('cash', 0))
+    columns['other_prizes_count'].append(prizes_counts.get('other', 0))
+    columns['registrations_count'].append(hackathon.get('registrations_count'))
+    columns['themes'].append(themes)
+    columns['featured'].append(hackathon.get('featured'))
+    columns['winners_announced'].append(hackathon.get('winners_announced'))
+    columns['invite_only'].append(hackathon.get('invite_only'))
+    columns['managed_by_devpost'].append(hackathon.get('managed_by_devpost_badge'))
+    columns['thumbnail_url'].append('https:' + thumbnail_url if thumbnail_url else '')
+    columns['submission_gallery_url'].append(hackathon.get('submission_gallery_url'))
+
+def hackathons_to_batch(hackathons: List[Dict]) -> pyarrow.RecordBatch:
+    """Flatten a page of hackathons column by column into a typed Arrow batch"""
+    columns = {name: [] for name in CSV_SCHEMA.names}
+    for hackathon in hackathons:
+        append_hackathon(columns, hackathon)
+    batch = pyarrow.RecordBatch.from_pydict(columns, schema=CSV_SCHEMA)
+
+    # Store empty strings as nulls so the Parquet copy agrees with CSV readers, which treat empty cells as missing
+    arrays = [
+        pyarrow.compute.if_else(pyarrow.compute.equal(column, ''), pyarrow.scalar(None, column.type), column)
+        if pyarrow.types.is_string(column.type) else column
+        for column in batch.columns
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=CSV_SCHEMA)
 
-async def fetch_all_hackathons(total_pages: int, first_page_hackathons: List[Dict]) -> List[Dict]:
-    """Fetch all pages concurrently with controlled concurrency"""
-    all_hackathons = []
+async def fetch_all_hackathons(session: aiohttp.ClientSession, cache: Dict[str, Dict], total_pages: int,
+                               first_page_hackathons: List[Dict], writers: List) -> int:
+    """Fetch all pages concurrently and write each page to every writer (CSV, Parquet) as it arrives"""
+    written = 0
+    failed_pages = []
+
+    def write_page(page_num: int, hackathons: List[Dict]):
+        """Write one page to every writer; a page that doesn't fit the schema is recorded as failed"""
+        nonlocal written
+        try:
+            batch = hackathons_to_batch(hackathons)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+            print(f"Page {page_num} has values that don't match the CSV schema: {e}", file=sys.stderr, flush=True)
+            failed_pages.append(page_num)
+            return
+        for writer in writers:
+            writer.write_batch(batch)
+        written += len(hackathons)
 
     # Add hackathons from first page
-    for hackathon in first_page_hackathons:
-        all_hackathons.append(flatten_hackathon(hackathon))
+    write_page(1, first_page_hackathons)
 
-    # Limit concurrent requests to avoid overwhelming the server
-    max_concurrent = 10  # Reduced from 50
-    semaphore = asyncio.Semaphore(max_concurrent)
+    async def fetch_numbered(page_num: int):
+        return page_num, await fetch_page_with_retry(session, page_num, cache=cache)
 
-    async with aiohttp.ClientSession() as session:
-        # Create tasks for all remaining pages
-        tasks = []
-        for page_num in range(2, total_pages + 1):
-            task = fetch_page_with_retry(session, page_num, semaphore)
-            tasks.append((page_num, task))
+    # Create tasks for all remaining pages
+    tasks = [asyncio.create_task(fetch_numbered(page_num)) for page_num in range(2, total_pages + 1)]
 
-        # Fetch all pages concurrently with progress updates
-        print(f"Fetching pages 2-{total_pages} with {max_concurrent} concurrent requests...", flush=True)
+    # Fetch all pages concurrently with progress updates
+    print(f"Fetching pages 2-{total_pages} with {MAX_CONCURRENT} concurrent requests...", flush=True)
 
-        completed = 0
-        failed_pages = []
+    completed = 0
 
-        for page_num, coro in tasks:
-            data = await coro
+    try:
+        # Process pages as they finish so a slow page doesn't hold up the rest
+        for fut in asyncio.as_completed(tasks):
+            page_num, data = await fut
             completed += 1
 
             if completed % 100 == 0 or completed == len(tasks):
                 print(f"Progress: {completed}/{len(tasks)} pages fetched ({completed*100//len(tasks)}%)", flush=True)
 
             if data and 'hackathons' in data:
-                for hackathon in data['hackathons']:
-                    all_hackathons.append(flatten_hackathon(hackathon))
+                write_page(page_num, data['hackathons'])
             else:
                 failed_pages.append(page_num)
+    finally:
+        # Don't leave requests running if a write fails or the run is interrupted
+        for task in tasks:
+            task.cancel()
 
-        if failed_pages:
-            print(f"\nWarning: {len(failed_pages)} pages failed to fetch", flush=True)
-            print(f"Failed pages (first 20): {failed_pages[:20]}", flush=True)
+    if failed_pages:
+        print(f"\nWarning: {len(failed_pages)} pages failed to fetch", flush=True)
+        print(f"Failed pages (first 20): {sorted(failed_pages)[:20]}", flush=True)
 
-    return all_hackathons
+    return written
 
 async def main():
     print("Fetching hackathon data from Devpost API (Improved Async)...", flush=True)
@@ -127,48 +241,82 @@ async def main():
     # Fetch first page to get total count
     print("Fetching page 1 to determine total pages...", flush=True)
 
-    async with aiohttp.ClientSession() as session:
-        url = "https://devpost.com/api/hackathons?page=1"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/json',
-        }
+    # One session for every request so page 1 and the fan-out share pooled keep-alive connections.
+    # The connector's pool limit is what caps concurrent requests.
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT, limit_per_host=MAX_CONCURRENT,
+                                     ttl_dns_cache=300, keepalive_timeout=30)
+    # Time out on connect/read only: a total timeout would also count time spent queued for the pool
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+    cache = load_etag_cache()
 
-        async with session.get(url, headers=headers) as response:
-            first_page = await response.json()
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Page 1 goes through the same retrying, conditional fetch as every other page,
+        # so on repeat runs it is usually a headers-only 304 served from the cache
+        first_page = await fetch_page_with_retry(session, 1, cache=cache)
 
-    if not first_page:
-        print("Failed to fetch first page. Exiting.", flush=True)
-        sys.exit(1)
+        if not first_page or not first_page.get('meta'):
+            print("Failed to fetch first page. Exiting.", flush=True)
+            sys.exit(1)
 
-    total_count = first_page['meta']['total_count']
-    per_page = first_page['meta']['per_page']
-    total_pages = (total_count + per_page - 1) // per_page
+        total_count = first_page['meta']['total_count']
+        per_page = first_page['meta']['per_page']
+        total_pages = (total_count + per_page - 1) // per_page
 
-    print(f"Total hackathons: {total_count}", flush=True)
-    print(f"Per page: {per_page}", flush=True)
-    print(f"Total pages: {total_pages}", flush=True)
+        print(f"Total hackathons: {total_count}", flush=True)
+        print(f"Per page: {per_page}", flush=True)
+        print(f"Total pages: {total_pages}", flush=True)
 
-    # Fetch all hackathons
-    all_hackathons = await fetch_all_hackathons(total_pages, first_page['hackathons'])
+        if not first_page['hackathons']:
+            print("No hackathons to save", flush=True)
+            return
 
-    print(f"\nFetched {len(all_hackathons)} hackathons total", flush=True)
+        # Stream rows to CSV as pages arrive instead of holding the whole dataset in memory
+        output_file = 'devpost_hackathons.csv.gz'
+        parquet_file = 'devpost_hackathons.parquet'
+        print(f"Writing to {output_file} and {parquet_file}...", flush=True)
 
-    # Write to CSV
-    output_file = 'devpost_hackathons.csv'
-    print(f"Writing to {output_file}...", flush=True)
+        # Write to temporary files next to the outputs and only swap them in once every page is done,
+        # so a failed or interrupted run leaves the previous dataset untouched
+        tmp_output_file = output_file + '.tmp'
+        tmp_parquet_file = parquet_file + '.tmp'
 
-    if all_hackathons:
-        fieldnames = all_hackathons[0].keys()
+        try:
+            # The Parquet copy is written from the same batches so chart generation can skip CSV parsing.
+            # It is opened first so it closes last and ends up at least as new as the CSV.
+            with pyarrow.parquet.ParquetWriter(tmp_parquet_file, CSV_SCHEMA, compression='zstd') as parquet_writer:
+                # The data is highly repetitive (organizations, themes, URLs), so gzip shrinks it several-fold
+                with gzip.open(tmp_output_file, 'wb', compresslevel=6) as f:
+                    # Arrow quotes header names, so write the plain header line ourselves
+                    f.write((','.join(CSV_SCHEMA.names) + '\n').encode('utf-8'))
+                    write_options = pyarrow.csv.WriteOptions(include_header=False, quoting_style='needed')
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_hackathons)
+                    with pyarrow.csv.CSVWriter(f, CSV_SCHEMA, write_options=write_options) as csv_writer:
+                        # Fetch all hackathons
+                        written = await fetch_all_hackathons(session, cache, total_pages,
+                                                             first_page['hackathons'], [csv_writer, parquet_writer])
+        except BaseException:
+            for path in (tmp_output_file, tmp_parquet_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
 
-        print(f"Successfully saved {len(all_hackathons)} hackathons to {output_file}", flush=True)
-    else:
-        print("No hackathons to save", flush=True)
+        # CSV first, so the Parquet copy is never older than the CSV it mirrors
+        os.replace(tmp_output_file, output_file)
+        os.replace(tmp_parquet_file, parquet_file)
+
+    save_etag_cache(cache)
+
+    print(f"\nFetched {written} hackathons total", flush=True)
+    print(f"Successfully saved {written} hackathons to {output_file} and {parquet_file}", flush=True)
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # uvloop is an optional, faster drop-in event loop; fall back to asyncio's default without it
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
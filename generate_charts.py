@@ -2,339 +2,387 @@
 """
 Generate meaningful charts from Devpost hackathon data
 """
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; safe to use from worker processes
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
-import re
 import numpy as np
+import multiprocessing
+import os
 
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
-# Read the data
-print("Reading data...")
-df = pd.read_csv('devpost_hackathons.csv')
-
-print(f"Loaded {len(df)} hackathons")
-print(f"Columns: {df.columns.tolist()}")
-
-# Create charts directory if it doesn't exist
-import os
-os.makedirs('charts', exist_ok=True)
+# First run of digits/commas in a prize string, e.g. "$75,000" -> "75,000".
+# Kept as a string: Arrow-backed str.extract compiles it natively and rejects re.Pattern objects.
+PRIZE_PATTERN = r'(?P<amount>[\d,]+)'
+
+def load_data() -> pd.DataFrame:
+    """Read the data, preferring the Parquet sidecar when it is at least as new as the CSV"""
+    csv_file = 'devpost_hackathons.csv.gz'
+    parquet_file = 'devpost_hackathons.parquet'
+    chart_columns = ['open_state', 'organization_name', 'themes', 'prize_amount', 'registrations_count',
+                     'location', 'featured', 'winners_announced', 'managed_by_devpost',
+                     'cash_prizes_count', 'other_prizes_count']
+
+    if os.path.exists(parquet_file) and os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file):
+        return pd.read_parquet(parquet_file, columns=chart_columns, dtype_backend='pyarrow')
+
+    df = pd.read_csv(csv_file, engine='pyarrow', dtype_backend='pyarrow',
+                     dtype={'cash_prizes_count': 'int32[pyarrow]', 'other_prizes_count': 'int32[pyarrow]',
+                            'registrations_count': 'int64[pyarrow]', 'featured': 'bool[pyarrow]',
+                            'winners_announced': 'bool[pyarrow]', 'managed_by_devpost': 'bool[pyarrow]'})
+    # Cache for the next run
+    df.to_parquet(parquet_file, compression='zstd')
+    return df[chart_columns]
+
+def bin_counts(values: pd.Series, bins: list, labels: list) -> pd.Series:
+    """Count values falling in each right-closed (bins[i], bins[i+1]] interval, as pd.cut does"""
+    idx = np.searchsorted(np.asarray(bins), values.to_numpy(dtype=np.int64), side='left') - 1
+    return pd.Series(np.bincount(idx, minlength=len(labels)), index=labels)
 
 # Chart 1: Hackathon Status Distribution
-print("\n1. Generating hackathon status distribution chart...")
-fig, ax = plt.subplots(figsize=(10, 6))
-status_counts = df['open_state'].value_counts()
-colors = ['#e74c3c', '#2ecc71', '#3498db']
-bars = ax.bar(range(len(status_counts)), status_counts.values, color=colors[:len(status_counts)])
-ax.set_xticks(range(len(status_counts)))
-ax.set_xticklabels(status_counts.index, fontsize=12)
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Hackathon Status Distribution', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels on top of bars
-for i, (bar, value) in enumerate(zip(bars, status_counts.values)):
-    percentage = (value / len(df)) * 100
-    ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-plt.tight_layout()
-plt.savefig('charts/01_status_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_status_distribution(status_counts: pd.Series, total: int):
+    print("1. Generating hackathon status distribution chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['#e74c3c', '#2ecc71', '#3498db']
+    bars = ax.bar(status_counts.index.astype(str), status_counts.values, color=colors[:len(status_counts)])
+    ax.tick_params(axis='x', labelsize=12)
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Hackathon Status Distribution', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels on top of bars
+    for i, (bar, value) in enumerate(zip(bars, status_counts.values)):
+        percentage = (value / total) * 100
+        ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
+                ha='center', va='bottom', fontweight='bold', fontsize=11)
+
+    plt.tight_layout()
+    plt.savefig('charts/01_status_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 2: Top 15 Organizations by Number of Hackathons
-print("2. Generating top organizations chart...")
-fig, ax = plt.subplots(figsize=(12, 8))
-org_counts = df['organization_name'].value_counts().head(15)
-bars = ax.barh(range(len(org_counts)), org_counts.values, color='#3498db')
-ax.set_yticks(range(len(org_counts)))
-ax.set_yticklabels(org_counts.index)
-ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Top 15 Organizations by Number of Hackathons', fontsize=16, fontweight='bold', pad=20)
-ax.invert_yaxis()
-
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, org_counts.values)):
-    ax.text(value + 0.5, i, str(value), va='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('charts/02_top_organizations.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_top_organizations(org_counts: pd.Series):
+    print("2. Generating top organizations chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(12, 8))
+    bars = ax.barh(org_counts.index.astype(str), org_counts.values, color='#3498db')
+    ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Top 15 Organizations by Number of Hackathons', fontsize=16, fontweight='bold', pad=20)
+    ax.invert_yaxis()
+
+    # Add value labels
+    for i, (bar, value) in enumerate(zip(bars, org_counts.values)):
+        ax.text(value + 0.5, i, str(value), va='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('charts/02_top_organizations.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 3: Most Popular Themes
-print("3. Generating popular themes chart...")
-all_themes = []
-for themes_str in df['themes'].dropna():
-    if isinstance(themes_str, str):
-        themes = [t.strip() for t in themes_str.split(',')]
-        all_themes.extend(themes)
-
-theme_counts = Counter(all_themes).most_common(15)
-themes, counts = zip(*theme_counts)
-
-fig, ax = plt.subplots(figsize=(12, 8))
-bars = ax.barh(range(len(themes)), counts, color='#e74c3c')
-ax.set_yticks(range(len(themes)))
-ax.set_yticklabels(themes)
-ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Top 15 Most Popular Hackathon Themes', fontsize=16, fontweight='bold', pad=20)
-ax.invert_yaxis()
-
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, counts)):
-    ax.text(value + 10, i, str(value), va='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('charts/03_popular_themes.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_popular_themes(theme_counts: pd.Series):
+    print("3. Generating popular themes chart...", flush=True)
+    themes, counts = theme_counts.index, theme_counts.values
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    bars = ax.barh(themes.astype(str), counts, color='#e74c3c')
+    ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Top 15 Most Popular Hackathon Themes', fontsize=16, fontweight='bold', pad=20)
+    ax.invert_yaxis()
+
+    # Add value labels
+    for i, (bar, value) in enumerate(zip(bars, counts)):
+        ax.text(value + 10, i, str(value), va='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('charts/03_popular_themes.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 4: Prize Distribution Analysis
-print("4. Generating prize distribution chart...")
-# Extract numeric prize amounts
-def extract_prize_amount(prize_str):
-    if pd.isna(prize_str) or prize_str == '':
-        return 0
-    # Remove dollar sign, commas, and extract numbers
-    match = re.search(r'[\d,]+', str(prize_str))
-    if match:
-        return int(match.group().replace(',', ''))
-    return 0
-
-df['prize_numeric'] = df['prize_amount'].apply(extract_prize_amount)
-
-# Filter out zero prizes and create bins
-prizes_with_value = df[df['prize_numeric'] > 0]['prize_numeric']
-
-fig, ax = plt.subplots(figsize=(12, 7))
-bins = [0, 5000, 10000, 25000, 50000, 100000, 250000, 500000, max(prizes_with_value)]
-labels = ['<$5K', '$5K-$10K', '$10K-$25K', '$25K-$50K', '$50K-$100K', '$100K-$250K', '$250K-$500K', '>$500K']
-prize_bins = pd.cut(prizes_with_value, bins=bins, labels=labels[:len(bins)-1])
-prize_counts = prize_bins.value_counts().sort_index()
-
-bars = ax.bar(range(len(prize_counts)), prize_counts.values, color='#f39c12')
-ax.set_xticks(range(len(prize_counts)))
-ax.set_xticklabels(prize_counts.index, rotation=45, ha='right')
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Prize Amount Distribution (Hackathons with Prizes)', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, prize_counts.values)):
-    ax.text(i, value + 5, str(value), ha='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('charts/04_prize_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_prize_distribution(prize_counts: pd.Series):
+    print("4. Generating prize distribution chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(12, 7))
+    bars = ax.bar(prize_counts.index.astype(str), prize_counts.values, color='#f39c12')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Prize Amount Distribution (Hackathons with Prizes)', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels
+    for i, (bar, value) in enumerate(zip(bars, prize_counts.values)):
+        ax.text(i, value + 5, str(value), ha='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('charts/04_prize_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 5: Registration Distribution
-print("5. Generating registration distribution chart...")
-# Filter out very high outliers for better visualization
-reg_data = df[df['registrations_count'] > 0]['registrations_count']
-q99 = reg_data.quantile(0.99)
-reg_filtered = reg_data[reg_data <= q99]
-
-fig, ax = plt.subplots(figsize=(12, 7))
-max_reg = max(reg_filtered)
-# Create bins dynamically based on max value
-bin_edges = [0, 100, 250, 500, 1000, 2500, 5000, 10000]
-# Only include bins that are less than max value
-bins = [b for b in bin_edges if b < max_reg] + [max_reg]
-# Create labels dynamically
-labels = []
-for i in range(len(bins)-1):
-    if i == 0:
-        labels.append(f'<{bins[1]}')
-    elif i == len(bins)-2:
-        labels.append(f'>{bins[-2]}')
-    else:
-        labels.append(f'{bins[i]}-{bins[i+1]}')
-
-reg_bins = pd.cut(reg_filtered, bins=bins, labels=labels)
-reg_counts = reg_bins.value_counts().sort_index()
-
-bars = ax.bar(range(len(reg_counts)), reg_counts.values, color='#9b59b6')
-ax.set_xticks(range(len(reg_counts)))
-ax.set_xticklabels(reg_counts.index, rotation=45, ha='right')
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Participant Registration Distribution', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, reg_counts.values)):
-    ax.text(i, value + 10, str(value), ha='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('charts/05_registration_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_registration_distribution(reg_counts: pd.Series):
+    print("5. Generating registration distribution chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(12, 7))
+    bars = ax.bar(reg_counts.index.astype(str), reg_counts.values, color='#9b59b6')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Participant Registration Distribution', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels
+    for i, (bar, value) in enumerate(zip(bars, reg_counts.values)):
+        ax.text(i, value + 10, str(value), ha='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('charts/05_registration_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 6: Location Distribution (Top 20)
-print("6. Generating location distribution chart...")
-location_counts = df['location'].value_counts().head(20)
+def chart_location_distribution(location_counts: pd.Series):
+    print("6. Generating location distribution chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(12, 8))
+    bars = ax.barh(location_counts.index.astype(str), location_counts.values, color='#1abc9c')
+    ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Top 20 Hackathon Locations', fontsize=16, fontweight='bold', pad=20)
+    ax.invert_yaxis()
+
+    # Add value labels
+    for i, (bar, value) in enumerate(zip(bars, location_counts.values)):
+        ax.text(value + 10, i, str(value), va='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('charts/06_location_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
-fig, ax = plt.subplots(figsize=(12, 8))
-bars = ax.barh(range(len(location_counts)), location_counts.values, color='#1abc9c')
-ax.set_yticks(range(len(location_counts)))
-ax.set_yticklabels(location_counts.index)
-ax.set_xlabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Top 20 Hackathon Locations', fontsize=16, fontweight='bold', pad=20)
-ax.invert_yaxis()
+# Chart 7: Featured vs Non-Featured Hackathons
+def chart_featured_distribution(featured_counts: pd.Series, total: int):
+    print("7. Generating featured hackathons chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['#95a5a6', '#3498db']
+    labels = ['Non-Featured' if not x else 'Featured' for x in featured_counts.index]
+    bars = ax.bar(labels, featured_counts.values, color=colors[:len(featured_counts)])
+    ax.tick_params(axis='x', labelsize=12)
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Featured vs Non-Featured Hackathons', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels on top of bars
+    for i, (bar, value) in enumerate(zip(bars, featured_counts.values)):
+        percentage = (value / total) * 100
+        ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
+                ha='center', va='bottom', fontweight='bold', fontsize=11)
+
+    plt.tight_layout()
+    plt.savefig('charts/07_featured_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, location_counts.values)):
-    ax.text(value + 10, i, str(value), va='center', fontweight='bold')
+# Chart 8: Cash vs Other Prizes
+def chart_prize_types(cash_counts: pd.Series, other_counts: pd.Series):
+    print("8. Generating prize types comparison chart...", flush=True)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
-plt.tight_layout()
-plt.savefig('charts/06_location_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+    # Cash prizes distribution
+    bars1 = ax1.bar(cash_counts.index.astype(str), cash_counts.values, color='#2ecc71')
+    ax1.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax1.set_title('Cash Prizes Distribution', fontsize=14, fontweight='bold')
 
-# Chart 7: Featured vs Non-Featured Hackathons
-print("7. Generating featured hackathons chart...")
-fig, ax = plt.subplots(figsize=(10, 6))
-featured_counts = df['featured'].value_counts()
-colors = ['#95a5a6', '#3498db']
-labels = ['Non-Featured' if not x else 'Featured' for x in featured_counts.index]
-bars = ax.bar(range(len(featured_counts)), featured_counts.values, color=colors[:len(featured_counts)])
-ax.set_xticks(range(len(featured_counts)))
-ax.set_xticklabels(labels, fontsize=12)
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Featured vs Non-Featured Hackathons', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels on top of bars
-for i, (bar, value) in enumerate(zip(bars, featured_counts.values)):
-    percentage = (value / len(df)) * 100
-    ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-plt.tight_layout()
-plt.savefig('charts/07_featured_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+    for i, (bar, value) in enumerate(zip(bars1, cash_counts.values)):
+        ax1.text(i, value + 10, str(value), ha='center', fontweight='bold')
 
-# Chart 8: Cash vs Other Prizes
-print("8. Generating prize types comparison chart...")
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-# Cash prizes distribution
-cash_data = df[df['cash_prizes_count'] > 0]['cash_prizes_count']
-cash_bins = [0, 1, 3, 5, 10, max(cash_data) + 1]
-cash_labels = ['1', '2-3', '4-5', '6-10', '>10']
-cash_binned = pd.cut(cash_data, bins=cash_bins, labels=cash_labels, include_lowest=True)
-cash_counts = cash_binned.value_counts().sort_index()
-
-bars1 = ax1.bar(range(len(cash_counts)), cash_counts.values, color='#2ecc71')
-ax1.set_xticks(range(len(cash_counts)))
-ax1.set_xticklabels(cash_counts.index)
-ax1.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax1.set_title('Cash Prizes Distribution', fontsize=14, fontweight='bold')
-
-for i, (bar, value) in enumerate(zip(bars1, cash_counts.values)):
-    ax1.text(i, value + 10, str(value), ha='center', fontweight='bold')
-
-# Other prizes distribution
-other_data = df[df['other_prizes_count'] > 0]['other_prizes_count']
-other_bins = [0, 1, 3, 5, 10, max(other_data) + 1]
-other_labels = ['1', '2-3', '4-5', '6-10', '>10']
-other_binned = pd.cut(other_data, bins=other_bins, labels=other_labels, include_lowest=True)
-other_counts = other_binned.value_counts().sort_index()
-
-bars2 = ax2.bar(range(len(other_counts)), other_counts.values, color='#e67e22')
-ax2.set_xticks(range(len(other_counts)))
-ax2.set_xticklabels(other_counts.index)
-ax2.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax2.set_title('Other Prizes Distribution', fontsize=14, fontweight='bold')
-
-for i, (bar, value) in enumerate(zip(bars2, other_counts.values)):
-    ax2.text(i, value + 5, str(value), ha='center', fontweight='bold')
-
-plt.suptitle('Prize Types Comparison', fontsize=16, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig('charts/08_prize_types_comparison.png', dpi=300, bbox_inches='tight')
-plt.close()
+    # Other prizes distribution
+    bars2 = ax2.bar(other_counts.index.astype(str), other_counts.values, color='#e67e22')
+    ax2.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax2.set_title('Other Prizes Distribution', fontsize=14, fontweight='bold')
+
+    for i, (bar, value) in enumerate(zip(bars2, other_counts.values)):
+        ax2.text(i, value + 5, str(value), ha='center', fontweight='bold')
+
+    plt.suptitle('Prize Types Comparison', fontsize=16, fontweight='bold', y=1.02)
+    plt.tight_layout()
+    plt.savefig('charts/08_prize_types_comparison.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 9: Winners Announced Status
-print("9. Generating winners announced status chart...")
-fig, ax = plt.subplots(figsize=(10, 6))
-winners_counts = df['winners_announced'].value_counts()
-colors = ['#3498db', '#f39c12']
-labels = ['Winners Not Announced' if not x else 'Winners Announced' for x in winners_counts.index]
-bars = ax.bar(range(len(winners_counts)), winners_counts.values, color=colors[:len(winners_counts)])
-ax.set_xticks(range(len(winners_counts)))
-ax.set_xticklabels(labels, fontsize=12)
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Hackathons by Winner Announcement Status', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels on top of bars
-for i, (bar, value) in enumerate(zip(bars, winners_counts.values)):
-    percentage = (value / len(df)) * 100
-    ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-plt.tight_layout()
-plt.savefig('charts/09_winners_announced.png', dpi=300, bbox_inches='tight')
-plt.close()
+def chart_winners_announced(winners_counts: pd.Series, total: int):
+    print("9. Generating winners announced status chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['#3498db', '#f39c12']
+    labels = ['Winners Not Announced' if not x else 'Winners Announced' for x in winners_counts.index]
+    bars = ax.bar(labels, winners_counts.values, color=colors[:len(winners_counts)])
+    ax.tick_params(axis='x', labelsize=12)
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Hackathons by Winner Announcement Status', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels on top of bars
+    for i, (bar, value) in enumerate(zip(bars, winners_counts.values)):
+        percentage = (value / total) * 100
+        ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
+                ha='center', va='bottom', fontweight='bold', fontsize=11)
+
+    plt.tight_layout()
+    plt.savefig('charts/09_winners_announced.png', dpi=300, bbox_inches='tight')
+    plt.close()
 
 # Chart 10: Managed by Devpost vs Community
-print("10. Generating management type chart...")
-fig, ax = plt.subplots(figsize=(10, 6))
-managed_counts = df['managed_by_devpost'].value_counts()
-colors = ['#c0392b', '#16a085']
-labels = ['Community Managed' if not x else 'Managed by Devpost' for x in managed_counts.index]
-bars = ax.bar(range(len(managed_counts)), managed_counts.values, color=colors[:len(managed_counts)])
-ax.set_xticks(range(len(managed_counts)))
-ax.set_xticklabels(labels, fontsize=12)
-ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
-ax.set_title('Hackathons by Management Type', fontsize=16, fontweight='bold', pad=20)
-
-# Add value labels on top of bars
-for i, (bar, value) in enumerate(zip(bars, managed_counts.values)):
-    percentage = (value / len(df)) * 100
-    ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
-            ha='center', va='bottom', fontweight='bold', fontsize=11)
-
-plt.tight_layout()
-plt.savefig('charts/10_management_type.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("\n✅ All charts generated successfully in 'charts/' directory!")
-
-# Generate summary statistics
-print("\n" + "="*60)
-print("DATA INSIGHTS SUMMARY")
-print("="*60)
-
-print(f"\n📊 Total Hackathons: {len(df):,}")
-print(f"🟢 Open: {len(df[df['open_state'] == 'open']):,}")
-print(f"🔴 Closed: {len(df[df['open_state'] == 'closed']):,}")
-
-print(f"\n💰 Prize Statistics:")
-prizes_with_value = df[df['prize_numeric'] > 0]
-print(f"   Hackathons with prizes: {len(prizes_with_value):,}")
-print(f"   Average prize: ${prizes_with_value['prize_numeric'].mean():,.0f}")
-print(f"   Median prize: ${prizes_with_value['prize_numeric'].median():,.0f}")
-print(f"   Highest prize: ${prizes_with_value['prize_numeric'].max():,.0f}")
-
-print(f"\n👥 Registration Statistics:")
-reg_with_value = df[df['registrations_count'] > 0]
-print(f"   Hackathons with registrations: {len(reg_with_value):,}")
-print(f"   Average registrations: {reg_with_value['registrations_count'].mean():,.0f}")
-print(f"   Median registrations: {reg_with_value['registrations_count'].median():,.0f}")
-print(f"   Highest registrations: {reg_with_value['registrations_count'].max():,.0f}")
-
-print(f"\n🏆 Top 3 Organizations:")
-for i, (org, count) in enumerate(df['organization_name'].value_counts().head(3).items(), 1):
-    print(f"   {i}. {org}: {count} hackathons")
-
-print(f"\n🎯 Top 3 Themes:")
-theme_counts = Counter(all_themes).most_common(3)
-for i, (theme, count) in enumerate(theme_counts, 1):
-    print(f"   {i}. {theme}: {count} hackathons")
-
-print(f"\n🌍 Top 3 Locations:")
-for i, (loc, count) in enumerate(df['location'].value_counts().head(3).items(), 1):
-    print(f"   {i}. {loc}: {count} hackathons")
-
-print(f"\n⭐ Featured: {len(df[df['featured'] == True]):,} ({len(df[df['featured'] == True])/len(df)*100:.1f}%)")
-print(f"🏅 Winners Announced: {len(df[df['winners_announced'] == True]):,} ({len(df[df['winners_announced'] == True])/len(df)*100:.1f}%)")
-print(f"🛡️  Managed by Devpost: {len(df[df['managed_by_devpost'] == True]):,} ({len(df[df['managed_by_devpost'] == True])/len(df)*100:.1f}%)")
-
-print("\n" + "="*60)
+def chart_management_type(managed_counts: pd.Series, total: int):
+    print("10. Generating management type chart...", flush=True)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['#c0392b', '#16a085']
+    labels = ['Community Managed' if not x else 'Managed by Devpost' for x in managed_counts.index]
+    bars = ax.bar(labels, managed_counts.values, color=colors[:len(managed_counts)])
+    ax.tick_params(axis='x', labelsize=12)
+    ax.set_ylabel('Number of Hackathons', fontsize=12, fontweight='bold')
+    ax.set_title('Hackathons by Management Type', fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels on top of bars
+    for i, (bar, value) in enumerate(zip(bars, managed_counts.values)):
+        percentage = (value / total) * 100
+        ax.text(i, value + 100, f'{value:,}\n({percentage:.1f}%)',
+                ha='center', va='bottom', fontweight='bold', fontsize=11)
+
+    plt.tight_layout()
+    plt.savefig('charts/10_management_type.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+def render_chart(chart_fn, args: tuple):
+    """Pool entry point: render one chart from its precomputed aggregates"""
+    chart_fn(*args)
+
+def main():
+    # Read the data
+    print("Reading data...")
+    df = load_data()
+
+    print(f"Loaded {len(df)} hackathons")
+    print(f"Columns: {df.columns.tolist()}")
+
+    # Create charts directory if it doesn't exist
+    os.makedirs('charts', exist_ok=True)
+
+    total = len(df)
+
+    # Full value counts are computed once and sliced by both the charts and the summary
+    status_vc = df['open_state'].value_counts()
+    org_vc = df['organization_name'].value_counts()
+    loc_vc = df['location'].value_counts()
+    theme_vc = df['themes'].dropna().str.split(',').explode().str.strip().value_counts()
+
+    # Precompute every chart's aggregates here so workers only receive small Series
+    org_counts = org_vc.head(15)
+    theme_counts = theme_vc.head(15)
+
+    # Extract numeric prize amounts
+    df['prize_numeric'] = (df['prize_amount'].str.extract(PRIZE_PATTERN, expand=False)
+                           .str.replace(',', '', regex=False)
+                           .fillna('0')
+                           .astype(np.int64))
+
+    # Filter out zero prizes and create bins
+    prizes_with_value = df[df['prize_numeric'] > 0]['prize_numeric']
+    bins = [0, 5000, 10000, 25000, 50000, 100000, 250000, 500000, max(prizes_with_value)]
+    labels = ['<$5K', '$5K-$10K', '$10K-$25K', '$25K-$50K', '$50K-$100K', '$100K-$250K', '$250K-$500K', '>$500K']
+    prize_counts = bin_counts(prizes_with_value, bins, labels[:len(bins)-1])
+
+    # Filter out very high outliers for better visualization
+    reg_data = df[df['registrations_count'] > 0]['registrations_count']
+    q99 = reg_data.quantile(0.99)
+    reg_filtered = reg_data[reg_data <= q99]
+
+    max_reg = max(reg_filtered)
+    # Create bins dynamically based on max value
+    bin_edges = [0, 100, 250, 500, 1000, 2500, 5000, 10000]
+    # Only include bins that are less than max value
+    bins = [b for b in bin_edges if b < max_reg] + [max_reg]
+    # Create labels dynamically
+    labels = []
+    for i in range(len(bins)-1):
+        if i == 0:
+            labels.append(f'<{bins[1]}')
+        elif i == len(bins)-2:
+            labels.append(f'>{bins[-2]}')
+        else:
+            labels.append(f'{bins[i]}-{bins[i+1]}')
+
+    reg_counts = bin_counts(reg_filtered, bins, labels)
+
+    location_counts = loc_vc.head(20)
+    featured_counts = df['featured'].value_counts()
+
+    # Cash prizes distribution
+    cash_data = df[df['cash_prizes_count'] > 0]['cash_prizes_count']
+    cash_bins = [0, 1, 3, 5, 10, max(cash_data) + 1]
+    cash_labels = ['1', '2-3', '4-5', '6-10', '>10']
+    cash_counts = bin_counts(cash_data, cash_bins, cash_labels)
+
+    # Other prizes distribution
+    other_data = df[df['other_prizes_count'] > 0]['other_prizes_count']
+    other_bins = [0, 1, 3, 5, 10, max(other_data) + 1]
+    other_labels = ['1', '2-3', '4-5', '6-10', '>10']
+    other_counts = bin_counts(other_data, other_bins, other_labels)
+
+    winners_counts = df['winners_announced'].value_counts()
+    managed_counts = df['managed_by_devpost'].value_counts()
+
+    tasks = [
+        (chart_status_distribution, (status_vc, total)),
+        (chart_top_organizations, (org_counts,)),
+        (chart_popular_themes, (theme_counts,)),
+        (chart_prize_distribution, (prize_counts,)),
+        (chart_registration_distribution, (reg_counts,)),
+        (chart_location_distribution, (location_counts,)),
+        (chart_featured_distribution, (featured_counts, total)),
+        (chart_prize_types, (cash_counts, other_counts)),
+        (chart_winners_announced, (winners_counts, total)),
+        (chart_management_type, (managed_counts, total)),
+    ]
+
+    # Charts are independent, so render them in parallel
+    processes = min(len(tasks), os.cpu_count() or 1)
+    print(f"\nRendering {len(tasks)} charts with {processes} processes...", flush=True)
+    with multiprocessing.Pool(processes=processes) as pool:
+        pool.starmap(render_chart, tasks)
+
+    print("\n✅ All charts generated successfully in 'charts/' directory!")
+
+    # Generate summary statistics
+    print("\n" + "="*60)
+    print("DATA INSIGHTS SUMMARY")
+    print("="*60)
+
+    print(f"\n📊 Total Hackathons: {total:,}")
+    print(f"🟢 Open: {int(status_vc.get('open', 0)):,}")
+    print(f"🔴 Closed: {int(status_vc.get('closed', 0)):,}")
+
+    print(f"\n💰 Prize Statistics:")
+    prizes_with_value = df[df['prize_numeric'] > 0]
+    print(f"   Hackathons with prizes: {len(prizes_with_value):,}")
+    print(f"   Average prize: ${prizes_with_value['prize_numeric'].mean():,.0f}")
+    print(f"   Median prize: ${prizes_with_value['prize_numeric'].median():,.0f}")
+    print(f"   Highest prize: ${prizes_with_value['prize_numeric'].max():,.0f}")
+
+    print(f"\n👥 Registration Statistics:")
+    reg_with_value = df[df['registrations_count'] > 0]
+    print(f"   Hackathons with registrations: {len(reg_with_value):,}")
+    print(f"   Average registrations: {reg_with_value['registrations_count'].mean():,.0f}")
+    print(f"   Median registrations: {reg_with_value['registrations_count'].median():,.0f}")
+    print(f"   Highest registrations: {reg_with_value['registrations_count'].max():,.0f}")
+
+    print(f"\n🏆 Top 3 Organizations:")
+    for i, (org, count) in enumerate(org_vc.head(3).items(), 1):
+        print(f"   {i}. {org}: {count} hackathons")
+
+    print(f"\n🎯 Top 3 Themes:")
+    for i, (theme, count) in enumerate(theme_vc.head(3).items(), 1):
+        print(f"   {i}. {theme}: {count} hackathons")
+
+    print(f"\n🌍 Top 3 Locations:")
+    for i, (loc, count) in enumerate(loc_vc.head(3).items(), 1):
+        print(f"   {i}. {loc}: {count} hackathons")
+
+    # Summing a boolean column counts the True rows without materializing a filtered frame
+    featured_n = int(df['featured'].sum())
+    winners_n = int(df['winners_announced'].sum())
+    managed_n = int(df['managed_by_devpost'].sum())
+    print(f"\n⭐ Featured: {featured_n:,} ({featured_n/total*100:.1f}%)")
+    print(f"🏅 Winners Announced: {winners_n:,} ({winners_n/total*100:.1f}%)")
+    print(f"🛡️  Managed by Devpost: {managed_n:,} ({managed_n/total*100:.1f}%)")
+
+    print("\n" + "="*60)
+
+if __name__ == '__main__':
+    main()